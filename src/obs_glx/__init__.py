@@ -1,5 +1,20 @@
 """Obsidian Graphs - AI-powered workflow automation for Obsidian vaults."""
 
-from .main import app
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .main import app
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    # The FastAPI app (and the client SDKs behind its router) is only loaded
+    # when requested, so the Celery worker can import config, db and graph
+    # modules without building the API.
+    if name != "app":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = import_module(".main", __name__).app
+    globals()[name] = value
+    return value
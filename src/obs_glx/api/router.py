@@ -16,6 +16,7 @@ from src.obs_glx.api.schemas import (
 )
 from src.obs_glx.config import obs_glx_settings
 from src.obs_glx.db.models.workflow import Workflow, WorkflowStatus
+from src.obs_glx.db.workflow_metadata import serialize_node_results
 from src.obs_glx.protocols import NexusClientProtocol, VaultServiceProtocol
 from src.obs_glx.services.github_draft_service import GitHubDraftServiceProtocol
 
@@ -139,7 +140,7 @@ async def run_workflow(
                 metadata = workflow.workflow_metadata or {}
                 metadata.update(
                     {
-                        "node_results": result.node_results,
+                        "node_results": serialize_node_results(result.node_results),
                         "total_changes": len(result.changes),
                         "branch_name": result.branch_name,
                     }
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     Enum,
+    Index,
     Integer,
     String,
     Text,
@@ -33,6 +34,10 @@ class Workflow(Base):
     """
 
     __tablename__ = "workflows"
+    __table_args__ = (
+        # Serves the workflow listing: filter by status, newest first
+        Index("ix_workflow_status_created_at", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     workflow_type = Column(
@@ -0,0 +1,26 @@
+"""Helpers for building the JSON stored in Workflow.workflow_metadata."""
+
+from typing import Dict
+
+from src.obs_glx.graphs.article_proposal.schemas import NodeRunResult
+
+# Upper bound on node messages persisted with workflow metadata
+MAX_PERSISTED_MESSAGE_LENGTH = 2048
+
+
+def serialize_node_results(node_results: Dict[str, NodeRunResult]) -> Dict[str, Dict]:
+    """
+    Convert node run results into JSON-serializable dictionaries.
+
+    Messages longer than MAX_PERSISTED_MESSAGE_LENGTH are truncated so that
+    verbose node output does not bloat the stored workflow metadata.
+    """
+    return {
+        name: {
+            "success": result.success,
+            "message": result.message[:MAX_PERSISTED_MESSAGE_LENGTH],
+            "changes_count": result.changes_count,
+            "metadata": dict(result.metadata),
+        }
+        for name, result in node_results.items()
+    }
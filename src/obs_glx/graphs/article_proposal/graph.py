@@ -1,6 +1,6 @@
 """LangGraph-based workflow orchestration for Obsidian Vault nodes."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Callable
 
 from langgraph.graph import END, StateGraph
@@ -10,6 +10,7 @@ from src.obs_glx.graphs.article_proposal.state import (
     FileChange,
     GraphState,
     NodeResult,
+    NodeRunResult,
     WorkflowStrategy,
 )
 from src.obs_glx.protocols import (
@@ -18,20 +19,31 @@ from src.obs_glx.protocols import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class WorkflowPlan:
     """
     Plan for workflow execution.
 
     Attributes:
-        nodes: Ordered list of node names to execute
+        nodes: Ordered node names to execute
         strategy: Workflow strategy identifier
     """
 
-    nodes: list[str]
+    nodes: tuple[str, ...]
     strategy: str
 
 
+# The default plan is static, so a single immutable instance is shared
+_DEFAULT_PLAN = WorkflowPlan(
+    nodes=(
+        "article_proposal",
+        "deep_research",
+        "submit_draft_branch",
+    ),
+    strategy=WorkflowStrategy.RESEARCH_PROPOSAL.value,
+)
+
+
 @dataclass
 class WorkflowResult:
     """
@@ -41,14 +53,14 @@ class WorkflowResult:
         success: Whether the workflow completed successfully
         changes: Aggregated list of all file changes from nodes
         summary: Human-readable summary of what was done
-        node_results: Dictionary mapping node names to their results
+        node_results: Dictionary mapping node names to their NodeRunResult
         branch_name: Name of the branch registered in GitHub
     """
 
     success: bool
     changes: list[FileChange]
     summary: str
-    node_results: dict = field(default_factory=dict)
+    node_results: dict[str, NodeRunResult] = field(default_factory=dict)
     branch_name: str = ""
 
 
@@ -122,7 +134,7 @@ class ArticleProposalGraph:
 
             # Override strategy if specified in request
             if request.strategy:
-                workflow_plan.strategy = request.strategy
+                workflow_plan = replace(workflow_plan, strategy=request.strategy)
 
             # Execute workflow
             workflow_result = await self._run_graph(
@@ -134,9 +146,11 @@ class ArticleProposalGraph:
             if not workflow_result.success:
                 raise Exception(f"Workflow execution failed: {workflow_result.summary}")
 
-            branch_result = workflow_result.node_results.get("submit_draft_branch", {})
-            branch_metadata = branch_result.get("metadata", {})
-            workflow_result.branch_name = branch_metadata.get("branch_name", "")
+            branch_result = workflow_result.node_results.get("submit_draft_branch")
+            if branch_result is not None:
+                workflow_result.branch_name = branch_result.metadata.get(
+                    "branch_name", ""
+                )
 
             return workflow_result
 
@@ -158,14 +172,7 @@ class ArticleProposalGraph:
         Note: This currently returns a fixed plan. If dynamic plan determination
         is needed in the future, replace this implementation with analysis logic.
         """
-        strategy = WorkflowStrategy.RESEARCH_PROPOSAL.value
-        nodes = [
-            "article_proposal",
-            "deep_research",
-            "submit_draft_branch",
-        ]
-
-        return WorkflowPlan(nodes=nodes, strategy=strategy)
+        return _DEFAULT_PLAN
 
     async def _run_graph(
         self,
@@ -191,7 +198,6 @@ class ArticleProposalGraph:
             "prompts": prompt_list,
             "accumulated_changes": [],
             "node_results": {},
-            "messages": [],
         }
 
         # Build state graph based on workflow plan
@@ -289,8 +295,8 @@ class ArticleProposalGraph:
         friendly_name = node_name.replace("_", " ").title()
         display_total = max(total_nodes, 1)
 
-        async def node_node(state: GraphState) -> GraphState:
-            """Execute the node and update state."""
+        async def node_node(state: GraphState) -> dict:
+            """Execute the node and return its state update."""
             node = self._get_node(node_name)
 
             if progress_callback:
@@ -311,23 +317,22 @@ class ArticleProposalGraph:
             if not result.success:
                 raise Exception(f"Node {node_name} failed: {result.message}")
 
-            # Update state with results
-            state["accumulated_changes"].extend(result.changes)
-            state["node_results"][node_name] = {
-                "success": result.success,
-                "message": result.message,
-                "changes_count": len(result.changes),
-                "metadata": result.metadata,
+            # Return a state delta; the reducers declared on GraphState append
+            # changes and merge node_results without in-place mutation.
+            # Node metadata is promoted to top-level keys for downstream nodes.
+            changes_count = len(result.changes)
+            update: dict = {
+                **result.metadata,
+                "accumulated_changes": result.changes,
+                "node_results": {
+                    node_name: NodeRunResult(
+                        success=result.success,
+                        message=result.message,
+                        changes_count=changes_count,
+                        metadata=result.metadata,
+                    )
+                },
             }
-            state["messages"].append(
-                f"{node_name}: {result.message} ({len(result.changes)} changes)"
-            )
-
-            # Merge node metadata into state for downstream nodes
-            if result.metadata:
-                # Update state in place
-                for key, value in result.metadata.items():
-                    state[key] = value
 
             if progress_callback:
                 after_percent = (
@@ -342,11 +347,13 @@ class ArticleProposalGraph:
                     after_percent,
                 )
 
-            return state
+            return update
 
         return node_node
 
-    def _generate_summary(self, node_results: dict, strategy: str) -> str:
+    def _generate_summary(
+        self, node_results: dict[str, NodeRunResult], strategy: str
+    ) -> str:
         """
         Generate human-readable summary of workflow execution.
 
@@ -357,20 +364,22 @@ class ArticleProposalGraph:
         Returns:
             Summary string
         """
-        successful_nodes = [
-            name for name, result in node_results.items() if result["success"]
-        ]
-        total_changes = sum(result["changes_count"] for result in node_results.values())
+        successful_count = 0
+        total_changes = 0
+        node_lines: list[str] = []
+
+        # Single pass over node results for counts and node-specific details
+        for node_name, result in node_results.items():
+            total_changes += result.changes_count
+            if result.success:
+                successful_count += 1
+                node_lines.append(f"- {node_name}: {result.message}")
 
         summary_parts = [
             f"Workflow completed with '{strategy}' strategy.",
-            f"Executed {len(successful_nodes)}/{len(node_results)} nodes successfully.",
+            f"Executed {successful_count}/{len(node_results)} nodes successfully.",
             f"Total changes: {total_changes} file operations.",
+            *node_lines,
         ]
 
-        # Add node-specific details
-        for node_name, result in node_results.items():
-            if result["success"]:
-                summary_parts.append(f"- {node_name}: {result['message']}")
-
         return "\n".join(summary_parts)
@@ -1,10 +1,22 @@
 """Node modules for Obsidian Vault workflow automation."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from src.obs_glx.graphs.article_proposal.state import FileChange, NodeResult
 
-from .node1_article_proposal import ArticleProposalNode
-from .node2_deep_research import DeepResearchNode
-from .node3_submit_draft_branch import SubmitDraftBranchNode
+if TYPE_CHECKING:
+    from .node1_article_proposal import ArticleProposalNode
+    from .node2_deep_research import DeepResearchNode
+    from .node3_submit_draft_branch import SubmitDraftBranchNode
+
+# Node classes are resolved on first access so that importing one node module
+# does not load the client stacks of the others.
+_LAZY_NODES = {
+    "ArticleProposalNode": ".node1_article_proposal",
+    "DeepResearchNode": ".node2_deep_research",
+    "SubmitDraftBranchNode": ".node3_submit_draft_branch",
+}
 
 __all__ = [
     "ArticleProposalNode",
@@ -13,3 +25,12 @@ __all__ = [
     "NodeResult",
     "FileChange",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_NODES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,12 +1,55 @@
 """Node for proposing new articles based on vault analysis."""
 
-import json
 from typing import Callable
 
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
 from src.obs_glx.graphs.article_proposal.prompts import render_prompt
-from src.obs_glx.graphs.article_proposal.state import NodeResult
+from src.obs_glx.graphs.article_proposal.state import (
+    EMPTY_CHANGES,
+    ArticleProposal,
+    NodeResult,
+)
 from src.obs_glx.protocols import NexusClientProtocol, NodeProtocol
 
+# Compiled once; validates every proposal's required fields in a single call
+_PROPOSALS_ADAPTER = TypeAdapter(list[ArticleProposal])
+
+
+def _extract_json_span(text: str, open_ch: str, close_ch: str) -> str | None:
+    """
+    Return the first balanced JSON span delimited by open_ch/close_ch.
+
+    Scans the text once, ignoring delimiters that appear inside JSON string
+    literals, so trailing prose containing brackets does not leak into the span.
+    """
+    start = text.find(open_ch)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == open_ch:
+            depth += 1
+        elif char == close_ch:
+            depth -= 1
+            if depth == 0:
+                return text[start : index + 1]
+    return None
+
 
 class ArticleProposalNode(NodeProtocol):
     """
@@ -94,9 +137,10 @@ class ArticleProposalNode(NodeProtocol):
             response = await llm_client.invoke(
                 [{"role": "user", "content": topic_prompt}]
             )
-            response_content = (
-                response.content if hasattr(response, "content") else str(response)
-            )
+            try:
+                response_content = response.content
+            except AttributeError:
+                response_content = str(response)
             topic_title = self._parse_topic_title(response_content)
 
             if topic_title is None:
@@ -110,13 +154,13 @@ class ArticleProposalNode(NodeProtocol):
             message = f"Generated research topic: {topic_title}"
 
             return NodeResult(
-                success=True, changes=[], message=message, metadata=metadata
+                success=True, changes=EMPTY_CHANGES, message=message, metadata=metadata
             )
 
         except Exception as e:
             return NodeResult(
                 success=False,
-                changes=[],
+                changes=EMPTY_CHANGES,
                 message=f"Failed to generate research topic: {str(e)}",
                 metadata={"error": str(e)},
             )
@@ -147,15 +191,16 @@ class ArticleProposalNode(NodeProtocol):
             response = await llm_client.invoke(
                 [{"role": "user", "content": proposal_prompt}]
             )
-            response_content = (
-                response.content if hasattr(response, "content") else str(response)
-            )
+            try:
+                response_content = response.content
+            except AttributeError:
+                response_content = str(response)
             proposals = self._parse_article_proposals(response_content)
 
             if proposals is None:
                 return NodeResult(
                     success=False,
-                    changes=[],
+                    changes=EMPTY_CHANGES,
                     message="Failed to parse LLM response: malformed JSON",
                     metadata={"error": "malformed_json"},
                 )
@@ -168,13 +213,13 @@ class ArticleProposalNode(NodeProtocol):
             message = f"Generated {len(proposals)} new article proposals"
 
             return NodeResult(
-                success=True, changes=[], message=message, metadata=metadata
+                success=True, changes=EMPTY_CHANGES, message=message, metadata=metadata
             )
 
         except Exception as e:
             return NodeResult(
                 success=False,
-                changes=[],
+                changes=EMPTY_CHANGES,
                 message=f"Failed to generate article proposals: {str(e)}",
                 metadata={"error": str(e)},
             )
@@ -189,26 +234,14 @@ class ArticleProposalNode(NodeProtocol):
         Returns:
             List of proposal dictionaries, or None if parsing fails
         """
-        # Try to extract JSON from the response by finding the first '[' and last ']'
-        start_index = llm_response.find("[")
-        end_index = llm_response.rfind("]")
-        if start_index != -1 and end_index > start_index:
-            json_str = llm_response[start_index : end_index + 1]
+        # Extract the first balanced JSON array from the response
+        json_str = _extract_json_span(llm_response, "[", "]")
+        if json_str is not None:
             try:
-                proposals = json.loads(json_str)
-                if isinstance(proposals, list):
-                    # Validate each proposal
-                    for proposal in proposals:
-                        required_fields = [
-                            "title",
-                            "category",
-                            "description",
-                            "filename",
-                        ]
-                        if not all(k in proposal for k in required_fields):
-                            return None
-                    return proposals
-            except json.JSONDecodeError:
+                proposals = orjson.loads(json_str)
+                _PROPOSALS_ADAPTER.validate_python(proposals)
+                return proposals
+            except (orjson.JSONDecodeError, ValidationError):
                 pass
         return None
 
@@ -1,12 +1,13 @@
 """Node for conducting deep research using ollama-deep-researcher service."""
 
+import asyncio
 import logging
-from datetime import datetime
+import time
 
 from starprobe_sdk import ResearchClientProtocol, ResearchResponse
 
 from src.obs_glx.graphs.article_proposal.state import (
-    FileAction,
+    EMPTY_CHANGES,
     FileChange,
     NodeResult,
 )
@@ -14,6 +15,8 @@ from src.obs_glx.protocols import NodeProtocol
 
 logger = logging.getLogger(__name__)
 
+_SLUG_TRANS = str.maketrans({" ": "-", ",": "", ".": ""})
+
 
 class DeepResearchNode(NodeProtocol):
     """
@@ -55,19 +58,17 @@ class DeepResearchNode(NodeProtocol):
             raise ValueError("Invalid context: topic_title is required")
 
         topic_title = state["topic_title"]
-        proposal_slug = state.get(
-            "proposal_slug",
-            topic_title.lower()
-            .replace(" ", "-")
-            .replace(",", "")
-            .replace(".", "")[:50],
-        )
+        # Only derive the slug when upstream nodes did not provide one
+        proposal_slug = state.get("proposal_slug")
+        if not proposal_slug:
+            proposal_slug = topic_title.lower().translate(_SLUG_TRANS)[:50]
 
         try:
-            # Call research API with topic
-            logger.info(f"Starting research for topic: {topic_title}")
-            research_result: ResearchResponse = self.research_client.research(
-                topic_title
+            # Call research API with topic; the client is blocking, so run it
+            # in a worker thread to keep the event loop free during the call
+            logger.info("Starting research for topic: %s", topic_title)
+            research_result: ResearchResponse = await asyncio.to_thread(
+                self.research_client.research, topic_title
             )
 
             if not research_result.success:
@@ -80,29 +81,26 @@ class DeepResearchNode(NodeProtocol):
             if not article_content:
                 raise ValueError("Research API response missing article content")
 
-            metadata = research_result.metadata or {}
-            if not isinstance(metadata, dict):
-                metadata = {}
+            research_metadata = research_result.metadata
+            if not isinstance(research_metadata, dict):
+                research_metadata = {}
 
-            diagnostics = list(research_result.diagnostics or [])
+            # Diagnostics are only passed through, so no defensive copy is needed
+            diagnostics = research_result.diagnostics or []
 
             # Generate unique filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"{proposal_slug}-{timestamp}.md"
             file_path = f"proposals/{filename}"
 
             # Create file change
-            file_change = FileChange(
-                path=file_path,
-                action=FileAction.CREATE,
-                content=article_content,
-            )
+            file_change = FileChange.create(path=file_path, content=article_content)
 
             metadata = {
                 "proposal_filename": filename,
                 "proposal_path": file_path,
-                "sources_count": metadata.get("source_count", 0),
-                "research_metadata": metadata,
+                "sources_count": research_metadata.get("source_count", 0),
+                "research_metadata": research_metadata,
                 "diagnostics": diagnostics,
                 "processing_time_seconds": research_result.processing_time,
             }
@@ -117,10 +115,10 @@ class DeepResearchNode(NodeProtocol):
             )
 
         except Exception as e:
-            logger.error(f"Deep research failed: {e}")
+            logger.error("Deep research failed: %s", e)
             return NodeResult(
                 success=False,
-                changes=[],
+                changes=EMPTY_CHANGES,
                 message=f"Failed to conduct research: {str(e)}",
                 metadata={"error": str(e)},
             )
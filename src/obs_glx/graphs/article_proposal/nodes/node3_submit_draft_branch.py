@@ -6,13 +6,17 @@ import re
 from pathlib import Path
 
 from src.obs_glx.graphs.article_proposal.state import (
+    EMPTY_CHANGES,
     FileAction,
     FileChange,
     NodeResult,
+    NodeRunResult,
 )
 from src.obs_glx.protocols import NodeProtocol
 from src.obs_glx.services.github_draft_service import GitHubDraftServiceProtocol
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
 
 class SubmitDraftBranchNode(NodeProtocol):
     """Transforms accumulated changes into a draft branch via GitHub."""
@@ -26,7 +30,6 @@ class SubmitDraftBranchNode(NodeProtocol):
         required_keys = ["strategy", "accumulated_changes", "node_results"]
         return all(key in state for key in required_keys)
 
-    # Async for protocol compatibility, no awaitable operations in this method
     async def execute(self, state: dict) -> NodeResult:
         if not self.validate_input(state):
             raise ValueError(
@@ -38,17 +41,19 @@ class SubmitDraftBranchNode(NodeProtocol):
         if not accumulated_changes:
             return NodeResult(
                 success=True,
-                changes=[],
+                changes=EMPTY_CHANGES,
                 message="No changes detected; skipping GitHub submission",
                 metadata={"branch_name": ""},
             )
 
         try:
-            draft_change = self._select_draft_change(accumulated_changes)
-            file_name = Path(draft_change.path).name
-            content = draft_change.content or ""
+            draft_changes = self._select_draft_changes(accumulated_changes)
 
-            drafts = [{"file_name": file_name, "content": content}]
+            # All drafts are submitted in one call so they share a single branch
+            drafts = [
+                {"file_name": Path(change.path).name, "content": change.content}
+                for change in draft_changes
+            ]
             response = await self._draft_service.create_draft_branch(drafts=drafts)
             if not isinstance(response, str):
                 raise ValueError(
@@ -65,46 +70,59 @@ class SubmitDraftBranchNode(NodeProtocol):
 
             return NodeResult(
                 success=True,
-                changes=[],
+                changes=EMPTY_CHANGES,
                 message=message,
                 metadata={
                     "branch_name": created_branch,
-                    "draft_file": draft_change.path,
+                    "draft_file": draft_changes[0].path,
+                    "draft_files": [change.path for change in draft_changes],
                 },
             )
 
         except Exception as exc:  # pragma: no cover - handled by workflow logging
             return NodeResult(
                 success=False,
-                changes=[],
+                changes=EMPTY_CHANGES,
                 message=f"Failed to submit draft branch: {exc}",
                 metadata={"error": str(exc)},
             )
 
-    def _select_draft_change(self, changes: list[FileChange]) -> FileChange:
-        create_changes = [c for c in changes if c.action is FileAction.CREATE]
-        if not create_changes:
+    def _select_draft_changes(self, changes: list[FileChange]) -> list[FileChange]:
+        draft_changes: list[FileChange] = []
+        # Drafts are stored by bare file name, so two drafts with the same name
+        # would collide on one repository path after the branch is created.
+        seen_names: set[str] = set()
+        for change in changes:
+            if change.action is FileAction.CREATE:
+                if not change.content:
+                    raise ValueError("Draft content is missing for GitHub submission.")
+                file_name = Path(change.path).name
+                if file_name in seen_names:
+                    raise ValueError(
+                        f"Duplicate draft file name '{file_name}' in accumulated changes."
+                    )
+                seen_names.add(file_name)
+                draft_changes.append(change)
+
+        if not draft_changes:
             raise ValueError("No draft creation detected in accumulated changes.")
-        if len(create_changes) > 1:
-            raise ValueError("Multiple draft files detected; expected a single draft.")
-
-        draft_change = create_changes[0]
-        if not draft_change.content:
-            raise ValueError("Draft content is missing for GitHub submission.")
 
-        return draft_change
+        return draft_changes
 
-    def _derive_branch_name(self, file_name: str, node_results: dict) -> str:
+    def _derive_branch_name(
+        self, file_name: str, node_results: dict[str, NodeRunResult]
+    ) -> str:
+        research_result = node_results.get("deep_research")
         metadata_filename = (
-            node_results.get("deep_research", {})
-            .get("metadata", {})
-            .get("proposal_filename")
+            research_result.metadata.get("proposal_filename")
+            if research_result is not None
+            else None
         )
 
+        # Both sources are bare file names, so plain string ops replace pathlib
         stem_source = metadata_filename or file_name
-        stem = Path(stem_source).stem.lower()
-        slug = re.sub(r"[^a-z0-9]+", "-", stem).strip("-")
-        if not slug:
-            slug = "draft"
+        dot = stem_source.rfind(".")
+        stem = (stem_source[:dot] if dot > 0 else stem_source).lower()
+        slug = _SLUG_RE.sub("-", stem).strip("-") or "draft"
 
         return f"draft/{slug}"
@@ -1,8 +1,28 @@
 """Prompt loader using Jinja2 templates."""
 
+from functools import lru_cache
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+# Templates live next to this file (src/obs_glx/graphs/article_proposal/prompts/)
+_TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+# A single environment is shared so its loader and template cache are reused.
+# Templates ship with the package and are cached below, so reload checks are off.
+_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATES_DIR),
+    autoescape=select_autoescape(),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+
+
+@lru_cache(maxsize=None)
+def _load_template(template_name: str) -> Template:
+    """Load and compile a template once per process."""
+    return _ENV.get_template(f"{template_name}.jinja")
 
 
 def render_prompt(template_name: str, **context) -> str:
@@ -16,18 +36,4 @@ def render_prompt(template_name: str, **context) -> str:
     Returns:
         Rendered prompt string
     """
-    # Get the directory of this file (src/prompts/)
-    prompts_dir = Path(__file__).parent
-    templates_dir = prompts_dir / "templates"
-
-    # Create Jinja2 environment
-    env = Environment(
-        loader=FileSystemLoader(templates_dir),
-        autoescape=select_autoescape(),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-
-    # Load and render template
-    template = env.get_template(f"{template_name}.jinja")
-    return template.render(**context)
+    return _load_template(template_name).render(**context)
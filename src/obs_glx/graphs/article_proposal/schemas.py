@@ -1,21 +1,22 @@
 """Pydantic models for article proposal graph schemas."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import (
-    TYPE_CHECKING,
     Annotated,
+    Any,
     Dict,
     List,
+    Mapping,
     NotRequired,
     Optional,
+    Sequence,
+    Tuple,
     TypedDict,
 )
 
-from pydantic import BaseModel
-
-if TYPE_CHECKING:
-    pass
+from pydantic import BaseModel, ConfigDict
 
 
 class FileAction(str, Enum):
@@ -26,7 +27,14 @@ class FileAction(str, Enum):
     DELETE = "delete"
 
 
-@dataclass
+# Actions whose FileChange must carry new file content
+_CONTENT_REQUIRED_ACTIONS = frozenset({FileAction.CREATE, FileAction.UPDATE})
+
+# Frozen dataclasses reject normal assignment; factories write slots directly
+_set_field = object.__setattr__
+
+
+@dataclass(slots=True, frozen=True)
 class FileChange:
     """
     Represents a file change to be applied to the vault.
@@ -43,16 +51,50 @@ class FileChange:
 
     def __post_init__(self):
         """Validate that content is provided for CREATE and UPDATE actions."""
-        if (
-            self.action in (FileAction.CREATE, FileAction.UPDATE)
-            and self.content is None
-        ):
-            raise ValueError(f"Content must be provided for {self.action.value} action")
-        if self.action == FileAction.DELETE and self.content is not None:
+        action = self.action
+        if action in _CONTENT_REQUIRED_ACTIONS and self.content is None:
+            raise ValueError(f"Content must be provided for {action.value} action")
+        if action is FileAction.DELETE and self.content is not None:
             raise ValueError("Content should not be provided for DELETE action")
 
+    @classmethod
+    def _build(
+        cls, path: str, action: FileAction, content: Optional[str]
+    ) -> "FileChange":
+        # The action is fixed by the calling factory, so only the content rule
+        # for that action is checked here instead of running __post_init__
+        if action is not FileAction.DELETE and content is None:
+            raise ValueError(f"Content must be provided for {action.value} action")
+        change = object.__new__(cls)
+        _set_field(change, "path", path)
+        _set_field(change, "action", action)
+        _set_field(change, "content", content)
+        return change
+
+    @classmethod
+    def create(cls, path: str, content: str) -> "FileChange":
+        """Build a CREATE change; raises ValueError if content is None."""
+        return cls._build(path, FileAction.CREATE, content)
+
+    @classmethod
+    def update(cls, path: str, content: str) -> "FileChange":
+        """Build an UPDATE change; raises ValueError if content is None."""
+        return cls._build(path, FileAction.UPDATE, content)
+
+    @classmethod
+    def delete(cls, path: str) -> "FileChange":
+        """Build a DELETE change, which never carries content."""
+        return cls._build(path, FileAction.DELETE, None)
+
 
-@dataclass
+# Shared read-only default for results that carry no metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Shared immutable value for results that produce no file changes
+EMPTY_CHANGES: Tuple[FileChange, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
 class NodeResult:
     """
     Result returned by node execution.
@@ -65,9 +107,27 @@ class NodeResult:
     """
 
     success: bool
-    changes: List[FileChange]
+    changes: Sequence[FileChange]
+    message: str
+    metadata: Mapping[str, Any] = _EMPTY_METADATA
+
+
+@dataclass(slots=True, frozen=True)
+class NodeRunResult:
+    """
+    Per-node execution record stored in the graph state's node_results.
+
+    Attributes:
+        success: Whether the node execution completed successfully
+        message: Human-readable description of what the node did
+        changes_count: Number of file changes produced by the node
+        metadata: Additional information returned by the node
+    """
+
+    success: bool
     message: str
-    metadata: Dict = field(default_factory=dict)
+    changes_count: int
+    metadata: Mapping[str, Any]
 
 
 class VaultSummary(BaseModel):
@@ -78,25 +138,49 @@ class VaultSummary(BaseModel):
         total_articles: Total number of markdown files in the vault.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     total_articles: int
 
 
+class ArticleProposal(BaseModel):
+    """Pydantic model for a single article proposal returned by the LLM."""
+
+    title: str
+    category: str
+    description: str
+    filename: str
+
+
 class NodeResultModel(BaseModel):
     """Pydantic model for node execution results."""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     changes: List[FileChange]
     message: str
     metadata: Dict = {}
 
 
+def concat_changes(
+    left: List[FileChange], right: Sequence[FileChange]
+) -> List[FileChange]:
+    """Reducer appending a node's changes, which may be any sequence."""
+    return [*left, *right]
+
+
+def merge_node_results(left: Dict, right: Dict) -> Dict:
+    """Reducer merging per-node result entries returned by graph nodes."""
+    return {**left, **right}
+
+
 class GraphStateModel(TypedDict):
     """TypedDict for graph state used by LangGraph."""
 
     vault_summary: VaultSummary
     strategy: str
     prompts: List[str]
-    accumulated_changes: List[FileChange]
-    node_results: Dict
-    messages: Annotated[List[str], "add_messages"]
+    accumulated_changes: Annotated[List[FileChange], concat_changes]
+    node_results: Annotated[Dict[str, NodeRunResult], merge_node_results]
     topic_title: NotRequired[str]  # Optional field for research topic
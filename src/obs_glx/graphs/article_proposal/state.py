@@ -4,11 +4,14 @@ from enum import Enum
 
 # Re-export Pydantic models for backward compatibility
 from src.obs_glx.graphs.article_proposal.schemas import (
+    EMPTY_CHANGES,
+    ArticleProposal,
     FileAction,
     FileChange,
     GraphStateModel,
     NodeResult,
     NodeResultModel,
+    NodeRunResult,
     VaultSummary,
 )
 
@@ -29,17 +32,16 @@ class WorkflowStatus(str, Enum):
 class GraphState(GraphStateModel):
     """State passed between nodes in the workflow graph."""
 
-    pass
-    """State passed between nodes in the workflow graph."""
-    pass
-
 
 __all__ = [
     "WorkflowStrategy",
     "WorkflowStatus",
+    "ArticleProposal",
     "FileAction",
     "FileChange",
+    "EMPTY_CHANGES",
     "NodeResult",
+    "NodeRunResult",
     "VaultSummary",
     "GraphState",
     "NodeResultModel",
@@ -10,6 +10,35 @@ from src.obs_glx.protocols import NexusClientProtocol, VaultServiceProtocol
 from src.obs_glx.services.github_draft_service import GitHubDraftServiceProtocol
 
 
+def _build_article_proposal_graph(
+    vault_service: VaultServiceProtocol,
+    llm_client_provider: Callable[[], NexusClientProtocol],
+    draft_service: GitHubDraftServiceProtocol,
+    research_client: ResearchClientProtocol,
+) -> WorkflowGraphProtocol:
+    from src.obs_glx import dependencies
+
+    return ArticleProposalGraph(
+        vault_service=vault_service,
+        article_proposal_node=dependencies.get_article_proposal_node(
+            llm_client_provider=llm_client_provider
+        ),
+        deep_research_node=dependencies.get_deep_research_node(
+            research_client=research_client
+        ),
+        submit_draft_branch_node=dependencies.get_submit_draft_branch_node(
+            draft_service=draft_service
+        ),
+    )
+
+
+# Registry of workflow types to graph builders; add new workflow types here
+_GRAPH_BUILDERS: dict[str, Callable[..., WorkflowGraphProtocol]] = {
+    "article-proposal": _build_article_proposal_graph,
+}
+_AVAILABLE_TYPES = ", ".join(_GRAPH_BUILDERS)
+
+
 def get_graph_builder(
     workflow_type: str,
     vault_service: VaultServiceProtocol | None = None,
@@ -36,6 +65,12 @@ def get_graph_builder(
     Supported workflow types:
         - article-proposal: Research topic proposal and article creation
     """
+    builder = _GRAPH_BUILDERS.get(workflow_type)
+    if builder is None:
+        raise ValueError(
+            f"Unknown workflow type: '{workflow_type}'. Available types: {_AVAILABLE_TYPES}"
+        )
+
     from src.obs_glx import dependencies
 
     # Use provided dependencies or get defaults
@@ -52,28 +87,9 @@ def get_graph_builder(
         starprobe_settings=dependencies.get_starprobe_settings(),
     )
 
-    graph_builders = {
-        "article-proposal": lambda: ArticleProposalGraph(
-            vault_service=vault_service,
-            article_proposal_node=dependencies.get_article_proposal_node(
-                llm_client_provider=llm_client_provider
-            ),
-            deep_research_node=dependencies.get_deep_research_node(
-                research_client=research_client
-            ),
-            submit_draft_branch_node=dependencies.get_submit_draft_branch_node(
-                draft_service=draft_service
-            ),
-        ),
-        # Future additions can be added here, e.g.:
-        # "content-improvement": lambda: dependencies.get_content_improvement_graph(...),
-    }
-
-    builder_factory = graph_builders.get(workflow_type)
-    if not builder_factory:
-        available_types = ", ".join(graph_builders.keys())
-        raise ValueError(
-            f"Unknown workflow type: '{workflow_type}'. Available types: {available_types}"
-        )
-
-    return builder_factory()
+    return builder(
+        vault_service=vault_service,
+        llm_client_provider=llm_client_provider,
+        draft_service=draft_service,
+        research_client=research_client,
+    )
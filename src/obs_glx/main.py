@@ -1,8 +1,10 @@
 from importlib import metadata
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from src.obs_glx.api.router import router as workflows_router
+from src.obs_glx.services.github_draft_service import GitHubConfigurationError
 
 try:
     version = metadata.version("obs-glx")
@@ -16,6 +18,14 @@ app = FastAPI(
 )
 
 
+@app.exception_handler(GitHubConfigurationError)
+async def github_configuration_error_handler(
+    request: Request, exc: GitHubConfigurationError
+) -> JSONResponse:
+    """Fail fast with 503 when a dependency provider cannot build its client."""
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -1,12 +1,42 @@
 """Service for managing read-only operations on the local Obsidian Vault."""
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from src.obs_glx.graphs.article_proposal.state import VaultSummary
 from src.obs_glx.protocols import VaultServiceProtocol
 
 
+def _walk_markdown(entries: Iterable[os.DirEntry]) -> Iterator[str]:
+    """
+    Yield paths of markdown files below the given directory entries.
+
+    Dot-prefixed entries (e.g. .obsidian, .trash, .git) are skipped and
+    symlinked directories are not followed.
+    """
+    for entry in entries:
+        name = entry.name
+        if name[0] == ".":
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            with os.scandir(entry.path) as children:
+                yield from _walk_markdown(children)
+        elif name[-3:] == ".md":
+            yield entry.path
+
+
+def _walk_files(base: str, relative_base: str = "") -> Iterator[str]:
+    """Yield vault-relative POSIX paths of all files below base."""
+    with os.scandir(base) as entries:
+        for entry in entries:
+            relative = relative_base + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path, relative + "/")
+            elif entry.is_file():
+                yield relative
+
+
 class VaultService(VaultServiceProtocol):
     """Service for handling read-only file operations within the Obsidian Vault."""
 
@@ -26,33 +56,32 @@ class VaultService(VaultServiceProtocol):
         if not target_path.is_relative_to(vault_path):
             raise ValueError(f"Path '{path}' escapes the configured vault root")
 
-        if not target_path.is_file():
-            raise FileNotFoundError(f"File not found in vault: {path}")
-
-        return target_path.read_text(encoding="utf-8")
+        # Let the open() call report missing files instead of a separate stat
+        try:
+            return target_path.read_text(encoding="utf-8")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            raise FileNotFoundError(f"File not found in vault: {path}") from None
 
     def list_files(self, path: str = "") -> List[str]:
         """List files from the local vault copy."""
         vault_path = self._require_vault_path()
         prefix = path.lstrip("/")
 
-        files: List[str] = []
-        for file_path in vault_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            relative = file_path.relative_to(vault_path).as_posix()
-            if prefix and not relative.startswith(prefix):
-                continue
-            files.append(relative)
-
-        return sorted(files)
+        files = _walk_files(str(vault_path))
+        if not prefix:
+            return sorted(files)
+        return sorted(relative for relative in files if relative.startswith(prefix))
 
     def get_vault_summary(self) -> VaultSummary:
-        """Compute a summary of the vault using the local copy."""
+        """
+        Compute a summary of the vault using the local copy.
+
+        The vault can change at any depth between calls, so the summary is
+        always computed from a single scandir walk rather than cached.
+        """
         vault_path = self._require_vault_path()
-        markdown_files = list(vault_path.rglob("*.md"))
-        total_articles = len(markdown_files)
+        with os.scandir(vault_path) as entries:
+            total_articles = sum(1 for _ in _walk_markdown(entries))
 
         return VaultSummary(
             total_articles=total_articles,
@@ -60,12 +89,13 @@ class VaultService(VaultServiceProtocol):
 
     def validate_vault_structure(self, vault_path: Path) -> bool:
         """Validate that the vault structure is intact after changes."""
-        if not vault_path.exists():
+        vault_dir = os.fspath(vault_path)
+        if not os.path.isdir(vault_dir):
             return False
 
-        # Check for at least some markdown files
-        markdown_files = list(vault_path.rglob("*.md"))
-        return len(markdown_files) > 0
+        # Stop at the first markdown file instead of collecting all of them
+        with os.scandir(vault_dir) as entries:
+            return any(_walk_markdown(entries))
 
     def _require_vault_path(self) -> Path:
         """Return the configured vault path or raise if it is missing."""
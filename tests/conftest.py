@@ -55,9 +55,11 @@ def db_engine(default_settings: ObsGlxSettings):
         with engine.connect() as conn:
             # Disable foreign key checks temporarily
             conn.execute(text("SET session_replication_role = 'replica';"))
-            # Truncate all tables
-            for table in reversed(Base.metadata.sorted_tables):
-                conn.execute(text(f'TRUNCATE TABLE "{table.name}" CASCADE;'))
+            # Truncate all tables in one statement and reset their sequences
+            table_list = ", ".join(
+                f'"{table.name}"' for table in reversed(Base.metadata.sorted_tables)
+            )
+            conn.execute(text(f"TRUNCATE TABLE {table_list} RESTART IDENTITY CASCADE;"))
             # Re-enable foreign key checks
             conn.execute(text("SET session_replication_role = 'origin';"))
             conn.commit()
@@ -81,10 +83,23 @@ def db_session(db_engine) -> Generator[Session, None, None]:
     """
     Provides a transaction-scoped session for each test function.
 
-    Tests run within transactions and are rolled back on completion,
-    ensuring DB state independence between tests.
+    The session is bound to a connection whose outer transaction is rolled
+    back on completion. Commits made by the test (including those in factory
+    functions) only release SAVEPOINTs, ensuring DB state independence
+    between tests.
     """
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    if connection.dialect.name == "sqlite":
+        # pysqlite defers BEGIN until the first DML statement, so releasing
+        # the first SAVEPOINT would commit. Start the outer transaction now.
+        connection.exec_driver_sql("BEGIN")
+    SessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
     db = SessionLocal()
 
     # Override FastAPI app's DI (get_db) with this test session
@@ -93,8 +108,9 @@ def db_session(db_engine) -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.rollback()  # Rollback all changes
         db.close()
+        transaction.rollback()  # Rollback all changes
+        connection.close()
         app.dependency_overrides.pop(create_db_session, None)
 
 
@@ -116,9 +132,9 @@ async def client(db_session: Session) -> AsyncGenerator[AsyncClient, None]:
 # =============================================================================
 
 
-@pytest.fixture
-def vault_fixture(tmp_path: Path, default_settings: ObsGlxSettings):
-    """Copy the configured vault submodule (or a subpath) into a temp directory."""
+@pytest.fixture(scope="session")
+def vault_source_root(default_settings: ObsGlxSettings) -> Path:
+    """Resolve and validate the configured vault submodule once per session."""
 
     project_root = Path(__file__).resolve().parents[1]
     configured_path = Path(default_settings.vault_submodule_path)
@@ -133,11 +149,18 @@ def vault_fixture(tmp_path: Path, default_settings: ObsGlxSettings):
             f"Vault submodule not available at {source_root}. Please run 'git submodule update --init --recursive' to initialize submodules."
         )
 
+    return source_root
+
+
+@pytest.fixture
+def vault_fixture(tmp_path: Path, vault_source_root: Path):
+    """Copy the configured vault submodule (or a subpath) into a temp directory."""
+
     def _copy_vault(subpath: str | None = None) -> Path:
-        source = source_root if subpath is None else source_root / subpath
+        source = vault_source_root if subpath is None else vault_source_root / subpath
         if not source.exists():
             if subpath is not None:
-                source = source_root
+                source = vault_source_root
             else:
                 raise FileNotFoundError(f"Vault source path does not exist: {source}")
 
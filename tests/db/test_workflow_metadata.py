@@ -0,0 +1,30 @@
+"""Tests for workflow metadata serialization helpers."""
+
+from src.obs_glx.db.workflow_metadata import (
+    MAX_PERSISTED_MESSAGE_LENGTH,
+    serialize_node_results,
+)
+from src.obs_glx.graphs.article_proposal.state import NodeRunResult
+
+
+def test_serialize_node_results_truncates_long_messages() -> None:
+    """Persisted node messages are capped in length."""
+    node_results = {
+        "deep_research": NodeRunResult(
+            success=True,
+            message="x" * (MAX_PERSISTED_MESSAGE_LENGTH + 10),
+            changes_count=1,
+            metadata={"sources_count": 3},
+        )
+    }
+
+    serialized = serialize_node_results(node_results)
+
+    assert serialized == {
+        "deep_research": {
+            "success": True,
+            "message": "x" * MAX_PERSISTED_MESSAGE_LENGTH,
+            "changes_count": 1,
+            "metadata": {"sources_count": 3},
+        }
+    }
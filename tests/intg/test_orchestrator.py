@@ -1,5 +1,6 @@
 """Unit tests for the ArticleProposalGraph orchestration."""
 
+from dataclasses import FrozenInstanceError
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -11,7 +12,11 @@ from src.obs_glx.graphs.article_proposal.graph import (
     WorkflowPlan,
     WorkflowResult,
 )
-from src.obs_glx.graphs.article_proposal.state import NodeResult
+from src.obs_glx.graphs.article_proposal.state import (
+    FileAction,
+    FileChange,
+    NodeResult,
+)
 
 
 class MockAgent(MagicMock):
@@ -59,7 +64,7 @@ def test_determine_workflow_plan_requires_prompt(article_proposal_graph):
         SimpleNamespace(prompts=["test prompt"], primary_prompt="test prompt"),
     )
 
-    assert plan.nodes == ["article_proposal", "deep_research", "submit_draft_branch"]
+    assert plan.nodes == ("article_proposal", "deep_research", "submit_draft_branch")
     assert plan.strategy == "research_proposal"
 
 
@@ -73,11 +78,22 @@ def test_determine_workflow_plan_uses_research_proposal_strategy_with_prompt(
 
     assert isinstance(plan, WorkflowPlan)
     assert plan.strategy == "research_proposal"
-    assert plan.nodes == [
+    assert plan.nodes == (
         "article_proposal",
         "deep_research",
         "submit_draft_branch",
-    ]
+    )
+
+
+def test_default_plan_is_shared_and_immutable(article_proposal_graph):
+    """The default plan should be a single frozen instance reused across requests."""
+    request = WorkflowRunRequest(prompts=["Research transformers"])
+
+    plan = article_proposal_graph.get_default_plan(request)
+
+    assert article_proposal_graph.get_default_plan(request) is plan
+    with pytest.raises(FrozenInstanceError):
+        plan.strategy = "other"  # type: ignore[misc]
 
 
 def test_determine_workflow_plan_validates_whitespace_only_prompt():
@@ -200,3 +216,34 @@ async def test_run_workflow_handles_failure(
     assert isinstance(result, WorkflowResult)
     assert not result.success
     assert "node failure" in result.summary
+
+
+async def test_run_workflow_accumulates_changes_across_nodes(mock_vault_service):
+    """Changes and node results from each node should be merged by the state reducers."""
+
+    def make_node(path: str) -> MagicMock:
+        node = MagicMock()
+
+        async def execute(context: dict) -> NodeResult:
+            return NodeResult(
+                success=True,
+                changes=[FileChange(path, FileAction.CREATE, "content")],
+                message=f"Created {path}",
+            )
+
+        node.execute.side_effect = execute
+        return node
+
+    graph = ArticleProposalGraph(
+        vault_service=mock_vault_service,
+        article_proposal_node=make_node("a.md"),
+        deep_research_node=make_node("b.md"),
+        submit_draft_branch_node=make_node("c.md"),
+    )
+
+    result = await graph.run_workflow(WorkflowRunRequest(prompts=["Test research"]))
+
+    assert result.success
+    assert [change.path for change in result.changes] == ["a.md", "b.md", "c.md"]
+    assert all(entry.changes_count == 1 for entry in result.node_results.values())
+    assert len(result.node_results) == 3
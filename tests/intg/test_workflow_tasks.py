@@ -1,5 +1,7 @@
 """Unit tests for Celery workflow tasks."""
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from src.obs_glx.db.database import Base
 from src.obs_glx.db.models.workflow import Workflow, WorkflowStatus
 from tests.db.conftest import create_pending_workflow
+from worker.obs_glx_worker import tasks
 from worker.obs_glx_worker.tasks import run_workflow_task
 
 
@@ -161,6 +164,41 @@ class TestRunWorkflowTask:
         )
         assert updated_workflow.status == WorkflowStatus.COMPLETED
 
+    @patch("worker.obs_glx_worker.tasks._prepare_workflow_directory")
+    @patch("worker.obs_glx_worker.tasks.get_db")
+    @patch("src.obs_glx.graphs.factory.get_graph_builder")
+    def test_task_holds_no_transaction_during_graph_run(
+        self,
+        mock_get_builder,
+        mock_get_db,
+        mock_prepare_dir,
+        test_db,
+    ):
+        """Test that no database transaction stays open while the graph runs."""
+        mock_prepare_dir.return_value = Path("/tmp/vault")
+        workflow = create_pending_workflow(test_db)
+        mock_get_db.return_value = iter([test_db])
+
+        mock_builder_instance = MagicMock()
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.changes = []
+        mock_result.summary = "Test"
+        mock_result.branch_name = "test-branch"
+        mock_result.node_results = {}
+        in_transaction: list[bool] = []
+
+        async def mock_run_workflow(request, progress_callback=None):
+            in_transaction.append(test_db.in_transaction())
+            return mock_result
+
+        mock_builder_instance.run_workflow = MagicMock(side_effect=mock_run_workflow)
+        mock_get_builder.return_value = mock_builder_instance
+
+        run_workflow_task(workflow.id)
+
+        assert in_transaction == [False]
+
     @patch("worker.obs_glx_worker.tasks._prepare_workflow_directory")
     @patch("worker.obs_glx_worker.tasks.get_db")
     @patch("src.obs_glx.graphs.factory.get_graph_builder")
@@ -498,3 +536,149 @@ class TestRunWorkflowTask:
         mock_builder_instance.run_workflow.assert_called_once()
         request = mock_builder_instance.run_workflow.call_args[0][0]
         assert request.prompts == ["Backend specific prompt"]
+
+    @patch("worker.obs_glx_worker.tasks._prepare_workflow_directory")
+    @patch("worker.obs_glx_worker.tasks.get_db")
+    @patch("src.obs_glx.graphs.factory.get_graph_builder")
+    def test_task_points_vault_service_at_prepared_directory(
+        self,
+        mock_get_builder,
+        mock_get_db,
+        mock_prepare_dir,
+        test_db,
+        tmp_path,
+    ):
+        """Test that the graph reads the vault copy prepared for this run."""
+        mock_prepare_dir.return_value = tmp_path
+        workflow = create_pending_workflow(test_db)
+        mock_get_db.return_value = iter([test_db])
+
+        mock_builder_instance = MagicMock()
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.changes = []
+        mock_result.summary = "Success"
+        mock_result.branch_name = "test-branch"
+        mock_result.node_results = {}
+        summaries = []
+
+        async def mock_run_workflow(request, progress_callback=None):
+            vault_service = mock_get_builder.call_args.kwargs["vault_service"]
+            summaries.append(vault_service.get_vault_summary())
+            return mock_result
+
+        mock_builder_instance.run_workflow = MagicMock(side_effect=mock_run_workflow)
+        mock_get_builder.return_value = mock_builder_instance
+        (tmp_path / "note.md").write_text("# Note")
+        workflow_id = workflow.id
+
+        run_workflow_task(workflow_id)
+
+        mock_prepare_dir.assert_called_once_with(workflow_id)
+        assert [summary.total_articles for summary in summaries] == [1]
+
+    @patch("worker.obs_glx_worker.tasks._prepare_workflow_directory")
+    @patch("worker.obs_glx_worker.tasks.get_db")
+    @patch("src.obs_glx.graphs.factory.get_graph_builder")
+    def test_task_fails_when_workspace_preparation_fails(
+        self,
+        mock_get_builder,
+        mock_get_db,
+        mock_prepare_dir,
+        test_db,
+    ):
+        """Test that a failed vault copy marks the workflow as failed."""
+        mock_prepare_dir.side_effect = FileNotFoundError("vault missing")
+        workflow = create_pending_workflow(test_db)
+        mock_get_db.return_value = iter([test_db])
+        workflow_id = workflow.id
+
+        with pytest.raises(FileNotFoundError):
+            run_workflow_task(workflow_id)
+
+        mock_get_builder.return_value.run_workflow.assert_not_called()
+        updated_workflow = (
+            test_db.query(Workflow).filter(Workflow.id == workflow_id).first()
+        )
+        assert updated_workflow.status == WorkflowStatus.FAILED
+        assert updated_workflow.error_message == "vault missing"
+
+
+class TestPrepareWorkflowDirectory:
+    """Tests for the per-run workflow directory setup."""
+
+    def test_copies_vault_into_unique_directories(self, tmp_path, monkeypatch):
+        """Test that each run gets its own workflow_<id>_ copy of the vault."""
+        source = tmp_path / "vault"
+        source.mkdir()
+        (source / "note.md").write_text("# Note")
+        base_path = tmp_path / "workflows"
+        monkeypatch.setattr(tasks, "WORKFLOW_TEMP_BASE_PATH", base_path)
+        monkeypatch.setattr(tasks, "_resolve_submodule_path", lambda: source)
+
+        first = tasks._prepare_workflow_directory(7)
+        second = tasks._prepare_workflow_directory(7)
+
+        assert first != second
+        for temp_dir in (first, second):
+            assert temp_dir.parent == base_path
+            assert temp_dir.name.startswith("workflow_7_")
+            assert (temp_dir / "note.md").read_text() == "# Note"
+
+
+class TestCleanupOldWorkflows:
+    """Tests for cleanup_old_workflows Celery task."""
+
+    def test_removes_only_stale_workflow_directories(self, tmp_path, monkeypatch):
+        """Test that stale workflow_* directories are removed and others kept."""
+        monkeypatch.setattr(tasks, "WORKFLOW_TEMP_BASE_PATH", tmp_path)
+        stale_time = time.time() - 10 * 24 * 60 * 60
+
+        stale_dirs = [tmp_path / f"workflow_{index}_old" for index in range(3)]
+        for stale_dir in stale_dirs:
+            (stale_dir / "notes").mkdir(parents=True)
+            (stale_dir / "notes" / "note.md").write_text("# Note")
+            os.utime(stale_dir, (stale_time, stale_time))
+
+        fresh_dir = tmp_path / "workflow_9_new"
+        fresh_dir.mkdir()
+        other_dir = tmp_path / "unrelated"
+        other_dir.mkdir()
+        os.utime(other_dir, (stale_time, stale_time))
+
+        tasks.cleanup_old_workflows()
+
+        assert not any(stale_dir.exists() for stale_dir in stale_dirs)
+        assert fresh_dir.exists()
+        assert other_dir.exists()
+
+    def test_warns_when_directory_is_only_partially_removed(
+        self, tmp_path, monkeypatch, caplog
+    ):
+        """Test that leftover entries are reported instead of logged as cleaned."""
+        stale_dir = tmp_path / "workflow_1_old"
+        stale_dir.mkdir()
+        # Simulate rmtree's error handler skipping entries it cannot remove
+        monkeypatch.setattr(tasks.shutil, "rmtree", lambda path, onexc=None: None)
+
+        with caplog.at_level("INFO", logger=tasks.logger.name):
+            tasks._remove_workflow_directory(stale_dir)
+
+        assert "partially removed" in caplog.text
+        assert "Cleaned up old workflow directory" not in caplog.text
+
+    def test_rmtree_error_handler_retries_only_removals(self, tmp_path, caplog):
+        """Test that the rmtree handler retries unlink and never raises."""
+        locked_file = tmp_path / "locked.md"
+        locked_file.write_text("# Locked")
+
+        tasks._make_writable_and_retry(
+            os.unlink, str(locked_file), PermissionError("denied")
+        )
+        assert not locked_file.exists()
+
+        with caplog.at_level("WARNING", logger=tasks.logger.name):
+            tasks._make_writable_and_retry(
+                os.open, str(tmp_path), PermissionError("denied")
+            )
+        assert "Failed to remove" in caplog.text
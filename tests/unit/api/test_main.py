@@ -0,0 +1,41 @@
+"""Unit tests for application-level error handling."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.obs_glx import dependencies
+from src.obs_glx.main import app
+from src.obs_glx.services.github_draft_service import GitHubConfigurationError
+
+
+@pytest.fixture
+def client():
+    """Create a test client whose GitHub draft service cannot be constructed."""
+
+    def failing_draft_service():
+        raise GitHubConfigurationError("GitHub token is not configured.")
+
+    def override_db():
+        yield MagicMock()
+
+    app.dependency_overrides[dependencies.get_db_session] = override_db
+    app.dependency_overrides[dependencies.get_github_draft_service] = (
+        failing_draft_service
+    )
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_dependency_configuration_error_returns_service_unavailable(client):
+    """A misconfigured client provider should short-circuit with 503."""
+    response = client.post(
+        "/api/workflows/article-proposal/run",
+        json={"prompts": ["Research transformers"]},
+    )
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "GitHub token is not configured."}
@@ -79,7 +79,7 @@ def client(test_db):
             success=True,
             summary="Workflow completed successfully",
             branch_name="test-branch",
-            node_results=[],
+            node_results={},
             changes=[],
         )
     )
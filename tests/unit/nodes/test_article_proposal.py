@@ -78,7 +78,7 @@ async def test_execute_with_valid_prompt(node, vault_path):
 
     assert isinstance(result, NodeResult)
     assert result.success is True
-    assert result.changes == []
+    assert result.changes == ()
     assert "topic_title" in result.metadata
     assert result.metadata["topic_title"] == "Impact of Transformer Models on NLP"
 
@@ -166,3 +166,36 @@ async def test_execute_tags_lowercase(node, vault_path, mock_llm):
 
     assert isinstance(result, NodeResult)
     assert result.success is True
+
+
+def test_parse_article_proposals_ignores_trailing_brackets(node):
+    """Test that only the first balanced JSON array is parsed."""
+    response = (
+        "Here are the proposals:\n"
+        '[{"title": "A [draft]", "category": "ml", "description": "d", '
+        '"filename": "a.md"}]\n'
+        "See also [1] for references."
+    )
+
+    proposals = node._parse_article_proposals(response)
+
+    assert proposals == [
+        {
+            "title": "A [draft]",
+            "category": "ml",
+            "description": "d",
+            "filename": "a.md",
+        }
+    ]
+
+
+def test_parse_article_proposals_unbalanced_returns_none(node):
+    """Test that an unterminated JSON array is rejected."""
+    assert node._parse_article_proposals('[{"title": "A"') is None
+
+
+def test_parse_article_proposals_missing_field_returns_none(node):
+    """Test that proposals missing a required field are rejected."""
+    response = '[{"title": "A", "category": "ml", "description": "d"}]'
+
+    assert node._parse_article_proposals(response) is None
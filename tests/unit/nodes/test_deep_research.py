@@ -1,5 +1,6 @@
 """Unit tests for DeepResearchNode."""
 
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -127,6 +128,27 @@ async def test_execute_preserves_article(node, vault_path, mock_research_client)
     assert content == expected_article
 
 
+@pytest.mark.asyncio
+async def test_execute_runs_research_off_event_loop_thread(
+    node, vault_path, mock_research_client
+):
+    """Test that the blocking research call does not run on the event loop thread."""
+    response = mock_research_client.research.return_value
+    call_threads = []
+
+    def record_thread(topic):
+        call_threads.append(threading.current_thread())
+        return response
+
+    mock_research_client.research.side_effect = record_thread
+
+    result = await node.execute({"topic_title": "Test Topic"})
+
+    assert result.success is True
+    assert call_threads
+    assert call_threads[0] is not threading.current_thread()
+
+
 @pytest.mark.asyncio
 async def test_execute_with_api_error(node, vault_path, mock_research_client):
     """Test that execute handles research API errors."""
@@ -141,7 +163,7 @@ async def test_execute_with_api_error(node, vault_path, mock_research_client):
 
     assert isinstance(result, NodeResult)
     assert result.success is False
-    assert result.changes == []
+    assert result.changes == ()
     assert "error" in result.metadata
     assert "API Error" in str(result.metadata["error"])
 
@@ -179,3 +201,12 @@ async def test_execute_unique_filenames(node, vault_path, mock_research_client):
     assert filename1 != filename2
     assert filename1.startswith("test-topic-")
     assert filename2.startswith("test-topic-")
+
+
+@pytest.mark.asyncio
+async def test_execute_derives_slug_from_topic_title(node, vault_path):
+    """Test that the filename slug is derived from the topic title when absent."""
+    result = await node.execute({"topic_title": "Hello, World. AI"})
+
+    assert result.success is True
+    assert result.metadata["proposal_filename"].startswith("hello-world-ai-")
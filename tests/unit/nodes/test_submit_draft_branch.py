@@ -7,7 +7,11 @@ import pytest
 from src.obs_glx.graphs.article_proposal.nodes.node3_submit_draft_branch import (
     SubmitDraftBranchNode,
 )
-from src.obs_glx.graphs.article_proposal.state import FileAction, FileChange
+from src.obs_glx.graphs.article_proposal.state import (
+    FileAction,
+    FileChange,
+    NodeRunResult,
+)
 
 
 @pytest.fixture
@@ -83,7 +87,7 @@ async def test_execute_submits_single_draft(node, draft_service):
 
 
 @pytest.mark.asyncio
-async def test_execute_raises_when_multiple_drafts(node):
+async def test_execute_submits_multiple_drafts_in_one_call(node, draft_service):
     change_a = FileChange(
         path="proposals/a.md",
         action=FileAction.CREATE,
@@ -103,8 +107,41 @@ async def test_execute_raises_when_multiple_drafts(node):
 
     result = await node.execute(context)
 
+    draft_service.create_draft_branch.assert_called_once_with(
+        drafts=[
+            {"file_name": "a.md", "content": "# A"},
+            {"file_name": "b.md", "content": "# B"},
+        ],
+    )
+    assert result.success is True
+    assert result.metadata["draft_file"] == "proposals/a.md"
+    assert result.metadata["draft_files"] == ["proposals/a.md", "proposals/b.md"]
+
+
+@pytest.mark.asyncio
+async def test_execute_rejects_duplicate_draft_file_names(node, draft_service):
+    change_a = FileChange(
+        path="proposals/note.md",
+        action=FileAction.CREATE,
+        content="# A",
+    )
+    change_b = FileChange(
+        path="archive/note.md",
+        action=FileAction.CREATE,
+        content="# B",
+    )
+
+    context = {
+        "strategy": "research_proposal",
+        "accumulated_changes": [change_a, change_b],
+        "node_results": {},
+    }
+
+    result = await node.execute(context)
+
+    draft_service.create_draft_branch.assert_not_called()
     assert result.success is False
-    assert "Multiple draft files detected" in result.message
+    assert "Duplicate draft file name 'note.md'" in result.message
 
 
 @pytest.mark.asyncio
@@ -134,6 +171,18 @@ def test_branch_name_derives_from_filename(node):
 
 
 def test_branch_name_uses_metadata_filename(node):
-    node_results = {"deep_research": {"metadata": {"proposal_filename": "AI.md"}}}
+    node_results = {
+        "deep_research": NodeRunResult(
+            success=True,
+            message="Generated draft",
+            changes_count=1,
+            metadata={"proposal_filename": "AI.md"},
+        )
+    }
     branch = node._derive_branch_name("ignored.md", node_results)
     assert branch == "draft/ai"
+
+
+def test_branch_name_falls_back_to_draft_slug(node):
+    branch = node._derive_branch_name("!!!.md", {})
+    assert branch == "draft/draft"
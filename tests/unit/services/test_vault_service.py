@@ -39,6 +39,15 @@ def test_get_file_content_rejects_outside_paths(vault_service: VaultService) ->
         vault_service.get_file_content("../outside.md")
 
 
+@pytest.mark.parametrize("path", ["articles/missing.md", "articles"])
+def test_get_file_content_missing_file_raises(
+    vault_service: VaultService, path: str
+) -> None:
+    """Missing files and directories should raise FileNotFoundError."""
+    with pytest.raises(FileNotFoundError, match="File not found in vault"):
+        vault_service.get_file_content(path)
+
+
 def test_list_files_returns_sorted_paths(vault_service: VaultService) -> None:
     """list_files should enumerate files relative to the vault root."""
     files = vault_service.list_files()
@@ -51,13 +60,59 @@ def test_list_files_filters_by_prefix(vault_service: VaultService) -> None:
     assert files == ["articles/first.md"]
 
 
+def test_list_files_includes_nested_directories(
+    vault_service: VaultService, vault_path: Path
+) -> None:
+    """list_files should descend into nested directories."""
+    nested_dir = vault_path / "articles" / "deep"
+    nested_dir.mkdir()
+    (nested_dir / "third.md").write_text("# Third", encoding="utf-8")
+
+    assert vault_service.list_files("articles/") == [
+        "articles/deep/third.md",
+        "articles/first.md",
+    ]
+
+
 def test_get_vault_summary_counts_files(vault_service: VaultService) -> None:
     """Vault summary should count markdown files correctly."""
     summary = vault_service.get_vault_summary()
     assert summary.total_articles == 2
 
 
+def test_get_vault_summary_skips_dot_directories(vault_path: Path) -> None:
+    """Markdown inside dot-directories such as .trash is not counted."""
+    trash_dir = vault_path / ".trash"
+    trash_dir.mkdir()
+    (trash_dir / "deleted.md").write_text("# Deleted", encoding="utf-8")
+
+    assert VaultService(vault_path).get_vault_summary().total_articles == 2
+
+
 def test_validate_vault_structure(vault_path: Path) -> None:
     """validate_vault_structure should verify vault directories containing markdown."""
     assert VaultService().validate_vault_structure(vault_path) is True
     assert VaultService().validate_vault_structure(vault_path / "missing") is False
+
+
+def test_validate_vault_structure_requires_markdown(tmp_path: Path) -> None:
+    """A directory without markdown files, or a plain file, is not a valid vault."""
+    (tmp_path / "notes.txt").write_text("plain", encoding="utf-8")
+
+    assert VaultService().validate_vault_structure(tmp_path) is False
+    assert VaultService().validate_vault_structure(tmp_path / "notes.txt") is False
+
+
+def test_get_vault_summary_counts_nested_additions(
+    vault_service: VaultService, vault_path: Path
+) -> None:
+    """Files added below nested directories should be reflected in the summary."""
+    nested_dir = vault_path / "articles" / "topic" / "sub"
+    nested_dir.mkdir(parents=True)
+    (nested_dir / "x.md").write_text("# X", encoding="utf-8")
+    assert vault_service.get_vault_summary().total_articles == 3
+
+    (nested_dir / "y.md").write_text("# Y", encoding="utf-8")
+    (nested_dir / "z.md").write_text("# Z", encoding="utf-8")
+
+    assert VaultService(vault_path).get_vault_summary().total_articles == 5
@@ -37,6 +37,25 @@ class TestConfigurationProviders:
         settings2 = dependencies.get_app_settings()
         assert settings1 is settings2
 
+    @pytest.mark.parametrize(
+        "provider",
+        [
+            dependencies.get_app_settings,
+            dependencies.get_nexus_settings,
+            dependencies.get_github_settings,
+            dependencies.get_db_settings,
+            dependencies.get_redis_settings,
+            dependencies.get_starprobe_settings,
+            dependencies.get_workflow_settings,
+        ],
+    )
+    def test_all_settings_providers_are_process_wide_singletons(self, provider):
+        """Every settings provider should parse the environment only once."""
+        provider.cache_clear()
+        assert provider() is provider()
+        assert provider.cache_info().misses == 1
+        provider.cache_clear()
+
 
 def test_get_github_settings(monkeypatch: MonkeyPatch):
     """Test that get_github_settings returns GitHubSettings."""
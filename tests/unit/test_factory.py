@@ -0,0 +1,27 @@
+"""Unit tests for the workflow graph factory."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.obs_glx.graphs.article_proposal.graph import ArticleProposalGraph
+from src.obs_glx.graphs.factory import get_graph_builder
+
+
+def test_get_graph_builder_returns_article_proposal_graph():
+    """Test that the registered workflow type builds its graph."""
+    graph = get_graph_builder(
+        "article-proposal",
+        vault_service=MagicMock(),
+        llm_client_provider=MagicMock(),
+        draft_service=MagicMock(),
+        research_client=MagicMock(),
+    )
+
+    assert isinstance(graph, ArticleProposalGraph)
+
+
+def test_get_graph_builder_unknown_type_lists_available_types():
+    """Test that an unknown workflow type is rejected with the registered types."""
+    with pytest.raises(ValueError, match="Available types: article-proposal"):
+        get_graph_builder("unknown")
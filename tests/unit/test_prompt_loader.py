@@ -2,7 +2,10 @@
 
 import pytest
 
-from src.obs_glx.graphs.article_proposal.prompts.loader import render_prompt
+from src.obs_glx.graphs.article_proposal.prompts.loader import (
+    _load_template,
+    render_prompt,
+)
 
 
 def test_render_prompt_with_context():
@@ -33,3 +36,14 @@ def test_render_prompt_unknown_template():
     # Act & Assert
     with pytest.raises(Exception):  # Jinja2 raises TemplateNotFound
         render_prompt("unknown_template")
+
+
+def test_render_prompt_reuses_compiled_template():
+    """Test that templates are compiled once and reused across renders."""
+    _load_template.cache_clear()
+
+    render_prompt("new_article_creation", total_articles=1)
+    render_prompt("new_article_creation", total_articles=2)
+
+    assert _load_template.cache_info().misses == 1
+    assert _load_template.cache_info().hits == 1
@@ -1,8 +1,13 @@
 """Unit tests for state module (FileAction, FileChange, NodeResult)."""
 
+from collections.abc import Mapping
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from src.obs_glx.graphs.article_proposal.schemas import concat_changes
 from src.obs_glx.graphs.article_proposal.state import (
+    EMPTY_CHANGES,
     FileAction,
     FileChange,
     NodeResult,
@@ -69,6 +74,17 @@ class TestFileChange:
         ):
             FileChange(path="test.md", action=FileAction.UPDATE, content=None)
 
+    def test_factory_constructors_require_content(self):
+        """Test that create/update factories validate content at runtime."""
+        with pytest.raises(
+            ValueError, match="Content must be provided for create action"
+        ):
+            FileChange.create("test.md", None)
+        with pytest.raises(
+            ValueError, match="Content must be provided for update action"
+        ):
+            FileChange.update("test.md", None)
+
     def test_delete_with_content_raises_error(self):
         """Test that DELETE with content raises ValueError."""
         with pytest.raises(
@@ -86,6 +102,29 @@ class TestFileChange:
         change2 = FileChange("test.md", FileAction.CREATE, "content")
         assert change1 == change2
 
+    def test_factory_constructors_match_validated_constructor(self):
+        """Test that the action-specific factories build equivalent changes."""
+        assert FileChange.create("a.md", "body") == FileChange(
+            "a.md", FileAction.CREATE, "body"
+        )
+        assert FileChange.update("a.md", "body") == FileChange(
+            "a.md", FileAction.UPDATE, "body"
+        )
+        assert FileChange.delete("a.md") == FileChange("a.md", FileAction.DELETE)
+
+    def test_file_change_is_slotted(self):
+        """Test that FileChange instances do not carry a per-instance dict."""
+        change = FileChange("test.md", FileAction.CREATE, "content")
+        assert not hasattr(change, "__dict__")
+
+    def test_file_change_is_frozen_and_hashable(self):
+        """Test that FileChange is immutable and usable for de-duplication."""
+        change = FileChange.create("test.md", "content")
+        with pytest.raises(FrozenInstanceError):
+            change.content = "other"
+        duplicate = FileChange("test.md", FileAction.CREATE, "content")
+        assert list(dict.fromkeys([change, duplicate])) == [change]
+
     def test_file_change_different_paths(self):
         """Test that FileChanges with different paths are not equal."""
         change1 = FileChange("test1.md", FileAction.CREATE, "content")
@@ -150,5 +189,30 @@ class TestNodeResult:
     def test_node_result_default_metadata(self):
         """Test that NodeResult has default empty metadata."""
         result = NodeResult(success=True, changes=[], message="Test")
-        assert isinstance(result.metadata, dict)
+        assert isinstance(result.metadata, Mapping)
         assert len(result.metadata) == 0
+
+    def test_node_result_default_metadata_is_shared_and_read_only(self):
+        """Test that results without metadata share one read-only mapping."""
+        first = NodeResult(success=True, changes=[], message="First")
+        second = NodeResult(success=True, changes=[], message="Second")
+        assert first.metadata is second.metadata
+        with pytest.raises(TypeError):
+            first.metadata["key"] = "value"
+
+    def test_node_result_is_frozen_and_slotted(self):
+        """Test that NodeResult is immutable and has no per-instance dict."""
+        result = NodeResult(success=True, changes=[], message="Test")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            result.success = False
+
+    def test_empty_changes_accumulate_with_lists(self):
+        """Test that the shared empty tuple merges with accumulated change lists."""
+        change = FileChange("test.md", FileAction.CREATE, "content")
+        result = NodeResult(success=True, changes=EMPTY_CHANGES, message="None")
+
+        accumulated = concat_changes([change], result.changes)
+
+        assert accumulated == [change]
+        assert concat_changes(accumulated, [change]) == [change, change]
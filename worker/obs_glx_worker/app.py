@@ -31,11 +31,20 @@ celery_app.conf.update(
     # Result backend settings
     result_expires=3600,  # Results expire after 1 hour
     # Retry settings
+    # Workflows are long and I/O-bound, so a message is only acknowledged once
+    # the task finishes; task_reject_on_worker_lost redelivers it if the
+    # worker process dies mid-run.
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+    # Broker connection settings
+    broker_pool_limit=10,
+    broker_connection_retry_on_startup=True,
     # Worker settings
+    # Reserve a single task at a time so a slow worker does not hold tasks
+    # that idle peers could pick up.
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    worker_disable_rate_limits=True,
 )
 
 # Auto-discover tasks
@@ -2,48 +2,91 @@
 
 import asyncio
 import logging
+import os
 import shutil
+import stat
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.obs_glx.config import obs_glx_settings, workflow_settings
 from src.obs_glx.db.database import get_db
 from src.obs_glx.db.models.workflow import Workflow, WorkflowStatus
+from src.obs_glx.db.workflow_metadata import serialize_node_results
 from worker.obs_glx_worker.app import celery_app
 
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]  # /app for worker container
 WORKFLOW_TEMP_BASE_PATH = Path(tempfile.gettempdir()) / "obs_glx" / "workflows"
+_CLEANUP_MAX_WORKERS = 8
 
 
+@lru_cache(maxsize=1)
 def _resolve_submodule_path() -> Path:
-    """Resolve the configured vault submodule path to an absolute path."""
+    """
+    Resolve the configured vault submodule path to an absolute path.
+
+    Settings are process-wide singletons, so the result is computed once per
+    worker process.
+    """
     raw_path = Path(obs_glx_settings.vault_submodule_path)
     source = raw_path if raw_path.is_absolute() else PROJECT_ROOT / raw_path
     return source
 
 
+def _make_workflow_temp_dir(workflow_id: int) -> Path:
+    """Atomically create a uniquely named directory for a workflow run."""
+    prefix = f"workflow_{workflow_id}_"
+    try:
+        return Path(tempfile.mkdtemp(prefix=prefix, dir=WORKFLOW_TEMP_BASE_PATH))
+    except FileNotFoundError:
+        # Only the first run in a fresh environment needs to create the base
+        WORKFLOW_TEMP_BASE_PATH.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix=prefix, dir=WORKFLOW_TEMP_BASE_PATH))
+
+
 def _prepare_workflow_directory(workflow_id: int) -> Path:
     """Copy the vault submodule into an isolated temporary directory."""
-    WORKFLOW_TEMP_BASE_PATH.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
-    temp_dir = WORKFLOW_TEMP_BASE_PATH / f"workflow_{workflow_id}_{timestamp}"
-
     source = _resolve_submodule_path()
     if not source.exists():
         raise FileNotFoundError(
             f"Configured vault submodule path does not exist: {source}"
         )
 
-    shutil.copytree(source, temp_dir)
+    temp_dir = _make_workflow_temp_dir(workflow_id)
+    shutil.copytree(source, temp_dir, dirs_exist_ok=True)
     return temp_dir
 
 
+def _make_writable_and_retry(func, path: str, exc: BaseException) -> None:
+    """
+    rmtree error handler that retries removals after restoring write permission.
+
+    Only failed unlink/rmdir calls are retried, once the parent directory is
+    writable again; rmtree also reports failed open/scandir/lstat calls here,
+    and retrying those removes nothing. The handler never raises, so cleanup
+    cannot fail the task; anything left behind is logged and swept up later
+    by cleanup_old_workflows.
+    """
+    if isinstance(exc, FileNotFoundError):
+        return
+    if func not in (os.unlink, os.rmdir):
+        logger.warning("Failed to remove %s: %s", path, exc)
+        return
+    try:
+        os.chmod(os.path.dirname(path), stat.S_IRWXU)
+        func(path)
+    except Exception as retry_exc:  # noqa: BLE001 - cleanup must not raise
+        logger.warning("Failed to remove %s: %s", path, retry_exc)
+
+
 def _set_workflow_progress(
     db: Session, workflow: Workflow, message: str, percent: int
 ) -> None:
@@ -82,10 +125,20 @@ def run_workflow_task(self, workflow_id: int) -> None:
 
     try:
         # 1. Retrieve workflow from database
-        workflow = db.query(Workflow).filter(Workflow.id == workflow_id).first()
+        workflow = db.execute(
+            select(Workflow).where(Workflow.id == workflow_id)
+        ).scalar_one_or_none()
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
 
+        # Read everything the run needs while the row is loaded. Commits expire
+        # the instance, and touching an expired attribute would open a new
+        # transaction that pins a pooled connection for the whole graph run.
+        workflow_type = workflow.workflow_type
+        raw_strategy = workflow.strategy
+        workflow_metadata = workflow.workflow_metadata or {}
+        prompt_value = workflow.prompt
+
         # 2. Update status to RUNNING
         workflow.status = WorkflowStatus.RUNNING
         workflow.started_at = datetime.now(timezone.utc)
@@ -116,22 +169,17 @@ def run_workflow_task(self, workflow_id: int) -> None:
         from src.obs_glx.graphs.factory import get_graph_builder
 
         graph_builder = get_graph_builder(
-            workflow_type=workflow.workflow_type,
+            workflow_type=workflow_type,
             vault_service=vault_service,
         )
 
         # Handle legacy strategies by coercing unknown values to RESEARCH_PROPOSAL
         try:
-            strategy = (
-                WorkflowStrategy(workflow.strategy) if workflow.strategy else None
-            )
+            strategy = WorkflowStrategy(raw_strategy) if raw_strategy else None
         except ValueError:
             strategy = WorkflowStrategy.RESEARCH_PROPOSAL
 
-        workflow_metadata = workflow.workflow_metadata or {}
-
         # Handle prompt: convert to list if needed for backward compatibility
-        prompt_value = workflow.prompt
         if prompt_value is None:
             prompt_value = ["Default research prompt"]
         elif isinstance(prompt_value, str):
@@ -159,7 +207,7 @@ def run_workflow_task(self, workflow_id: int) -> None:
             workflow.branch_name = result.branch_name
             workflow_metadata.update(
                 {
-                    "node_results": result.node_results,
+                    "node_results": serialize_node_results(result.node_results),
                     "total_changes": len(result.changes),
                     "branch_name": result.branch_name,
                 }
@@ -193,8 +241,23 @@ def run_workflow_task(self, workflow_id: int) -> None:
         db.close()
 
         # Remove temporary workflow directory
-        if temp_vault_dir and temp_vault_dir.exists():
-            shutil.rmtree(temp_vault_dir, ignore_errors=True)
+        if temp_vault_dir is not None:
+            shutil.rmtree(temp_vault_dir, onexc=_make_writable_and_retry)
+
+
+def _remove_workflow_directory(temp_dir: Path) -> None:
+    """Delete a stale workflow directory, logging instead of raising on failure."""
+    try:
+        shutil.rmtree(temp_dir, onexc=_make_writable_and_retry)
+    except Exception as e:  # noqa: BLE001 - log cleanup failure
+        logger.error("Failed to clean up %s: %s", temp_dir, e)
+        return
+
+    # The error handler logs and skips entries it cannot remove
+    if temp_dir.exists():
+        logger.warning("Old workflow directory only partially removed: %s", temp_dir)
+    else:
+        logger.info("Cleaned up old workflow directory: %s", temp_dir)
 
 
 @celery_app.task(name="cleanup_old_workflows")
@@ -210,15 +273,24 @@ def cleanup_old_workflows() -> None:
     if not clone_base_path.exists():
         return
 
-    # Clean up any workflow_* directories older than configured seconds
-    current_time = time.time()
-    for temp_dir in clone_base_path.glob("workflow_*"):
-        if temp_dir.is_dir():
-            # Check if directory is older than configured time
-            dir_age = current_time - temp_dir.stat().st_mtime
-            if dir_age > workflow_settings.temp_dir_cleanup_seconds:
-                try:
-                    shutil.rmtree(temp_dir)
-                    logger.info("Cleaned up old workflow directory: %s", temp_dir)
-                except Exception as e:  # noqa: BLE001 - log cleanup failure
-                    logger.error("Failed to clean up %s: %s", temp_dir, e)
+    # Collect workflow_* directories older than configured seconds. DirEntry
+    # answers is_dir() from d_type and caches stat(), so each entry costs at
+    # most one stat call.
+    cutoff = time.time() - workflow_settings.temp_dir_cleanup_seconds
+    with os.scandir(clone_base_path) as entries:
+        stale_dirs = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith("workflow_")
+            and entry.is_dir(follow_symlinks=False)
+            and entry.stat(follow_symlinks=False).st_mtime < cutoff
+        ]
+    if not stale_dirs:
+        return
+
+    # rmtree is dominated by unlink/rmdir syscalls, which release the GIL,
+    # so removing several trees at once overlaps the filesystem work.
+    with ThreadPoolExecutor(
+        max_workers=min(_CLEANUP_MAX_WORKERS, len(stale_dirs))
+    ) as executor:
+        list(executor.map(_remove_workflow_directory, stale_dirs))